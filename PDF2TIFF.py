@@ -1,9 +1,212 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import sys
 import uuid
+import json
+import mmap
+import pickle
+import shutil
+import hashlib
+from collections import namedtuple
+import multiprocessing
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 import arcpy
 
+# Worker-side code lives in a plain module next to the toolbox: spawned workers import it by
+# name, which they can't do for a .pyt. The folder goes on sys.path (and so into each
+# child's spawn preparation data) before anything is submitted.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+from pdf2tiff_worker import (
+    _remove_stale_files, _delete_stale, _export_page, _finish_raster, _export_one_page,
+    _warm_projection_db, _init_worker,
+)
+
+try:
+    from pypdf import PdfReader  # optional — page count from the trailer/page tree, no full parse
+except ImportError:
+    PdfReader = None
+
+# Runs of Windows-reserved characters / whitespace, collapsed to '_' in table names
+_FS_UNSAFE_RUN = re.compile(r'[<>:"/\\|?*\s]+')
+
+# One skipped page; field order matches the failures table columns, so it inserts as-is
+Failure = namedtuple("Failure", "page pdf_path output error")
+_FAILURE_DTYPE = np.dtype([
+    ("Page", "i4"),
+    ("PDF_Path", "U512"),
+    ("Output_Path", "U512"),
+    ("Error", "U1024"),
+])
+
+
+# ---------- rerun cache: pages of an identical PDF already exported into the folder ----------
+_CACHE_MANIFEST = ".pdf2tiff_cache.json"
+
+
+def _pdf_fingerprint(pdf_path, out_sr_wkt):
+    h = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:  # mmap refuses empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    # The same page reprojected into another SR is a different output
+    h.update((out_sr_wkt or "").encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _read_manifest(output_folder):
+    """The folder's manifest as stored, or None if missing / unreadable. Never writes."""
+    try:
+        with open(os.path.join(output_folder, _CACHE_MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("pages"), dict):
+        return None
+    return manifest
+
+
+def _load_manifest(output_folder, fingerprint):
+    """{"fingerprint": ..., "pages": {"<page_1b>": "<tif name>"}} for this PDF, or a fresh one."""
+    manifest = _read_manifest(output_folder)
+    if manifest is not None and manifest.get("fingerprint") == fingerprint:
+        return manifest
+    # Different (or no) PDF on record: claim the folder now, so a run that dies half-way
+    # through overwriting files can't leave the old manifest vouching for them
+    manifest = {"fingerprint": fingerprint, "pages": {}}
+    if not _save_manifest(output_folder, manifest):
+        # Can't claim it (read-only, held open by a sync/AV tool, ...): the old manifest must not
+        # outlive this run's overwrites, so remove it and run without the cache
+        try:
+            os.remove(os.path.join(output_folder, _CACHE_MANIFEST))
+        except FileNotFoundError:
+            pass
+        raise OSError(f"could not write {_CACHE_MANIFEST} in {output_folder}")
+    return manifest
+
+
+def _save_manifest(output_folder, manifest):
+    """Write the manifest atomically; False if it couldn't be written."""
+    path = os.path.join(output_folder, _CACHE_MANIFEST)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def _reuse_cached_page(output_folder, manifest, page_1b, output_path):
+    """Put the cached TIFF for 'page_1b' at 'output_path' (hard link, else copy); None if not cached."""
+    name = manifest["pages"].get(str(page_1b))
+    if not name:
+        return None
+    cached_path = os.path.join(output_folder, name)
+    if not os.path.isfile(cached_path):
+        return None
+    if os.path.normcase(os.path.abspath(cached_path)) == os.path.normcase(os.path.abspath(output_path)):
+        return output_path  # same Project ID / County as last time: file is already in place
+
+    _delete_stale(output_path)
+    try:
+        for ext in ("", ".aux.xml"):
+            if ext and not os.path.exists(cached_path + ext):
+                continue
+            try:
+                os.link(cached_path + ext, output_path + ext)
+            except OSError:
+                shutil.copy2(cached_path + ext, output_path + ext)
+    except OSError:
+        return None
+    return output_path
+# -----------------------------------------------------------------------------------------
+
+
+def _use_python_executable():
+    # Inside ArcGIS Pro sys.executable is ArcGISPro.exe; spawned workers need the bundled interpreter
+    if not os.path.basename(sys.executable).lower().startswith("python"):
+        multiprocessing.set_executable(os.path.join(sys.exec_prefix, "pythonw.exe"))
+
+
+# Export workers are kept warm across runs: each one pays the multi-second arcpy import
+# once, at startup, instead of on every execute. Gains flatten out past ~4 workers, and one
+# core is left for ArcGIS Pro itself.
+_POOL = None
+_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+
+def _get_pool():
+    global _POOL
+    if _POOL is None:
+        _use_python_executable()
+        _POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _POOL
+
+
+def _discard_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+def _warm_pool():
+    # Workers spawn on demand; poke each one so the arcpy imports overlap the user filling in the dialog
+    if _POOL is not None:
+        return  # already started for an earlier PDF, workers are still warm
+    try:
+        pool = _get_pool()
+        for _ in range(_POOL_WORKERS):
+            pool.submit(_init_worker)
+    except Exception:
+        _discard_pool()
+# -----------------------------------------------------------------------------------------
+
+
+class _MsgBuf:
+    """Batches GP messages: each AddMessage/AddWarning is a synchronous round-trip to the GP pane."""
+
+    def __init__(self, flush_every=50):
+        self.msgs = []
+        self.warns = []
+        self.flush_every = flush_every
+
+    def msg(self, text):
+        self.msgs.append(text)
+        self._maybe_flush()
+
+    def warn(self, text):
+        self.warns.append(text)
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if len(self.msgs) + len(self.warns) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self.msgs:
+            arcpy.AddMessage("\n".join(self.msgs))
+            self.msgs.clear()
+        if self.warns:
+            arcpy.AddWarning("\n".join(self.warns))
+            self.warns.clear()
+
+
 class Toolbox:
     def __init__(self):
         self.label = "Toolbox"
@@ -11,9 +214,15 @@ class Toolbox:
         self.tools = [Tool]
 
 class Tool:
+    # (path, mtime, size) -> page_count; class level because Pro builds separate Tool
+    # instances for the dialog and for execution
+    _pc_cache = {}
+
     def __init__(self):
         self.label = "PDF2TIFF"
         self.description = "PDF to TIFF (base behavior) + skip failures + failures table named by Project ID in project GDB"
+        # PDF the page dropdowns were last filled from
+        self._last_pdf_path = None
 
     def getParameterInfo(self):
         params = []
@@ -89,16 +298,24 @@ class Tool:
     def updateParameters(self, parameters):
         input_pdf, output_folder, page_start, page_end, project_id, county = parameters
 
-        # Populate page dropdowns from the chosen PDF
-        if input_pdf.altered and input_pdf.valueAsText and os.path.isfile(input_pdf.valueAsText):
+        # Populate page dropdowns from the chosen PDF — only when the PDF value itself changed
+        pdf_path = input_pdf.valueAsText
+        # (arcpy flags the PDF parameter as unvalidated on plenty of unrelated dialog events,
+        # so also require the path to differ from the one the dropdowns came from — unless the
+        # dropdowns are empty: Pro may hand this instance a fresh set of parameters)
+        if (input_pdf.altered and pdf_path and not input_pdf.hasBeenValidated
+                and (pdf_path != self._last_pdf_path or not page_start.filter.list)
+                and os.path.isfile(pdf_path)):
             try:
-                pdf_doc = arcpy.mp.PDFDocumentOpen(input_pdf.valueAsText)
-                page_count = pdf_doc.pageCount  # 1-based
-                del pdf_doc
+                page_count = self._page_count(pdf_path)  # 1-based
+                _warm_pool()  # a PDF was picked, so a run is likely: start the workers now
 
-                pages = [str(i) for i in range(1, page_count + 1)]
-                page_start.filter.list = pages
-                page_end.filter.list   = pages
+                # The lists are always "1".."N", so they only need rebuilding when N changes;
+                # each filter assignment re-serializes the whole list to the GP framework
+                if len(page_start.filter.list) != page_count or len(page_end.filter.list) != page_count:
+                    pages = list(map(str, range(1, page_count + 1)))
+                    page_start.filter.list = pages
+                    page_end.filter.list   = pages
 
                 # Defaults (only if user hasn't set them yet)
                 if not page_start.altered:
@@ -115,8 +332,11 @@ class Tool:
                 except Exception:
                     pass
 
+                self._last_pdf_path = pdf_path
+
             except Exception as ex:
                 arcpy.AddWarning(f"Could not read PDF page count: {ex}")
+                self._last_pdf_path = None
                 page_start.filter.list = []
                 page_end.filter.list   = []
 
@@ -143,32 +363,36 @@ class Tool:
         return
 
     # ---------- helpers ----------
-    @staticmethod
-    def _sanitize_for_fs(s, maxlen=120):
-        return re.sub(r'[<>:"/\\|?*\s]+', '_', s.strip())[:maxlen]
+    def _page_count(self, path):
+        # Opening the PDF is the slow part; only pay that again if the file changed
+        key = (path, os.path.getmtime(path), os.path.getsize(path))
+        if key in self._pc_cache:
+            return self._pc_cache[key]
+        n = None
+        if PdfReader is not None:
+            try:
+                with open(path, "rb", buffering=1 << 16) as f:
+                    n = len(PdfReader(f, strict=False).pages)
+            except Exception:
+                n = None  # encrypted / malformed — let arcpy have a go
+        if n is None:
+            pdf_doc = arcpy.mp.PDFDocumentOpen(path)
+            n = pdf_doc.pageCount
+            del pdf_doc
+        self._pc_cache[key] = n
+        return n
 
     @staticmethod
-    def _sr_equal(a, b):
-        try:
-            if a.factoryCode and b.factoryCode:
-                return a.factoryCode == b.factoryCode
-            return a.name == b.name
-        except Exception:
-            return False
+    def _sanitize_for_fs(s, maxlen=120):
+        return _FS_UNSAFE_RUN.sub("_", s.strip())[:maxlen]
 
     @staticmethod
-    def _pick_transform(in_sr, out_sr):
+    def _sr_key(sr):
+        # Plain (factoryCode, name) tuple — read once so per-page comparisons don't go back into arcpy
         try:
-            cands = arcpy.ListTransformations(in_sr, out_sr)
-            if not cands:
-                return ""
-            for key in ("NAD_1983", "HARN", "NSRS2007", "2011", "ETRS", "NAVD"):
-                for c in cands:
-                    if key in c:
-                        return c
-            return cands[0]
+            return (sr.factoryCode or 0, sr.name)
         except Exception:
-            return ""
+            return (0, None)
     # -----------------------------
 
     def execute(self, parameters, messages):
@@ -182,25 +406,31 @@ class Tool:
         county         = parameters[5].valueAsText
 
         # Ensure output folder exists (user chooses it; we don't autofill)
-        if output_folder:
-            root, ext = os.path.splitext(output_folder)
-            if ext and not os.path.isdir(output_folder):
-                maybe_dir = os.path.dirname(output_folder)
-                if maybe_dir and os.path.isdir(maybe_dir):
-                    output_folder = maybe_dir
-        if not os.path.isdir(output_folder):
-            os.makedirs(output_folder, exist_ok=True)
+        if output_folder and os.path.splitext(output_folder)[1] and not os.path.isdir(output_folder):
+            maybe_dir = os.path.dirname(output_folder)
+            if maybe_dir and os.path.isdir(maybe_dir):
+                output_folder = maybe_dir
+        os.makedirs(output_folder, exist_ok=True)  # no-op when it already exists
 
         # Get map + target SR
         aprx = arcpy.mp.ArcGISProject("CURRENT")
         map_obj = aprx.activeMap or (aprx.listMaps()[0] if aprx.listMaps() else None)
+        # Where a failures table would go; resolved now so the failure branch is a straight write
+        default_gdb = aprx.defaultGeodatabase
+        if not default_gdb or not os.path.isdir(default_gdb):
+            # Fallback to project home if default GDB missing (rare)
+            default_gdb = aprx.homeFolder
         target_sr = map_obj.spatialReference if map_obj else arcpy.SpatialReference(4326)
+        try:
+            target_wkt = target_sr.exportToString() if target_sr.name != "Unknown" else None
+        except Exception:
+            target_wkt = None
+        target_key = self._sr_key(target_sr)
+        _warm_projection_db(target_sr if target_wkt else None)
 
-        # Preflight: page count & requested range
+        # Preflight: page count & requested range (reuse the dialog's read when the file is unchanged)
         try:
-            pdf_doc = arcpy.mp.PDFDocumentOpen(input_pdf_path)
-            page_count = pdf_doc.pageCount
-            del pdf_doc
+            page_count = self._page_count(input_pdf_path)
         except Exception as ex:
             arcpy.AddError(f"Could not read page count: {ex}")
             raise arcpy.ExecuteError
@@ -216,133 +446,192 @@ class Tool:
         # Failure collector — recorded only when an export fails
         failures = []
 
-        # --- helpers (scoped to execute) ---
-        def pick_transform(in_sr, out_sr):
-            return self._pick_transform(in_sr, out_sr)
-
-        def project_raster_in_place(in_path, out_sr):
-            """
-            Reproject 'in_path' to 'out_sr' IN PLACE (base behavior):
-            - If input has Unknown CRS -> no-op.
-            - If CRS matches out_sr -> no-op.
-            - Else ProjectRaster to a temporary path in same folder, then replace original.
-            """
-            try:
-                desc = arcpy.Describe(in_path)
-                in_sr = getattr(desc, "spatialReference", None)
-            except Exception as ex:
-                arcpy.AddWarning(f"[WARN] Describe failed on {in_path}: {ex}")
-                return in_path
-
-            if (in_sr is None) or (in_sr.name == "Unknown"):
-                # Export succeeded; just no defined CRS — treat as success
-                return in_path
-
-            if self._sr_equal(in_sr, out_sr):
-                return in_path
-
-            folder = os.path.dirname(in_path)
-            base, _ = os.path.splitext(os.path.basename(in_path))
-            tmp_path = os.path.join(folder, f"{base}.__tmp_{uuid.uuid4().hex}.tif")
-
-            gtrans = pick_transform(in_sr, out_sr)
-            try:
-                arcpy.management.ProjectRaster(
-                    in_raster=in_path,
-                    out_raster=tmp_path,
-                    out_coor_system=out_sr,
-                    resampling_type="NEAREST",
-                    cell_size=None,
-                    geographic_transform=gtrans if gtrans else ""
-                )
-                try:
-                    arcpy.management.Delete(in_path)
-                except Exception:
-                    pass
-                os.replace(tmp_path, in_path)
-            except Exception as ex_proj:
-                # Reprojection failed — keep original (don’t record as a page failure)
-                arcpy.AddWarning(f"[WARN] Reprojection failed for {os.path.basename(in_path)}: {ex_proj}")
-            return in_path
-        # --- end helpers ---
-
-        # Export loop — EXACT base working call, but skip pages on failure
-        for page_num in range(start_page, end_page + 1):
-            page_1b = page_num + 1
-            pagestring = str(page_1b).zfill(2)  # 01, 02, ...
-            county_suffix = f"{county}_County_Project"
-            output_filename = f"{project_id}_p{pagestring}_{county_suffix}.tif"
-            output_path = os.path.join(output_folder, output_filename)
-
-            # Clean any previous export to avoid locks/warnings
-            if os.path.exists(output_path):
-                try:
-                    arcpy.management.Delete(output_path)
-                except Exception:
-                    pass
+        # (page_1b, path) of every exported TIFF, added to the map once all pages are done
+        final_paths = []
+        # Per-page progress/warnings go through a buffer: one GP round-trip per ~50 lines
+        buf = _MsgBuf()
+
+        def record_failure(page_1b, ex_export):
+            # SKIP this page and record failure (do not raise)
+            failures.append(Failure(page_1b, input_pdf_path, out_template % page_1b, str(ex_export)))
+            buf.warn(f"[SKIP] Page {page_1b} failed: {ex_export}")
+
+        def finish_page(page_1b, final_path, warnings, reused=False):
+            # Reprojection (done alongside the export) never turns a page into a failure
+            for w in warnings:
+                buf.warn(w)
+            if reused:
+                buf.msg(f"[OK] Reused page {page_1b} from the rerun cache → {os.path.basename(final_path)}")
+            else:
+                buf.msg(f"[OK] Exported page {page_1b} → {os.path.basename(final_path)}")
+
+            # Queue the one-and-only file for the map; added after the export loop
+            final_paths.append((page_1b, final_path))
+            # A page whose reprojection warned may still be in the source SR; don't let later
+            # runs reuse it from the cache
+            if manifest is not None:
+                if warnings:
+                    manifest["pages"].pop(str(page_1b), None)
+                else:
+                    manifest["pages"][str(page_1b)] = os.path.basename(final_path)
+
+        # Output naming is loop-invariant apart from the page number: build the template once
+        # (literal '%' in folder / IDs is doubled so %-formatting only fills in the page)
+        def esc(v):
+            return v.replace("%", "%%")
+        county_suffix = f"{esc(county)}_County_Project"
+        out_template = os.path.join(esc(output_folder), f"{esc(project_id)}_p%02d_{county_suffix}.tif")
+
+        # Export loop — pages are independent, so fan them out over a process pool
+        pages = list(range(start_page + 1, end_page + 2))
+
+        # Preflight before spending any export time: folder writable...
+        if not os.access(output_folder, os.W_OK):
+            arcpy.AddError(f"Output folder is not writable: {output_folder}")
+            raise arcpy.ExecuteError
 
-            # --- Core export (legacy 4-arg) ---
-            try:
-                # Base behavior that worked for you: (in_pdf, out_tif, pdf_password, pdf_page_number)
-                arcpy.conversion.PDFToTIFF(
-                    input_pdf_path,
-                    output_path,
-                    None,
-                    page_1b
-                )
-                arcpy.AddMessage(f"[OK] Exported page {page_1b} → {output_filename}")
-
-            except Exception as ex_export:
-                # SKIP this page and record failure (do not raise)
-                failures.append({
-                    "pdf_path": input_pdf_path,
-                    "page": page_1b,
-                    "output": output_path,
-                    "error": str(ex_export)
-                })
-                arcpy.AddWarning(f"[SKIP] Page {page_1b} failed: {ex_export}")
+        # ...and no leftover TIFF that is about to be rewritten still locked (e.g. a layer in the
+        # open map). Checked before the rerun cache touches anything; a page the manifest already
+        # records under this exact name is reused in place, not rewritten, so it may stay open.
+        recorded = (_read_manifest(output_folder) or {"pages": {}})["pages"]
+        locked = []
+        for p in pages:
+            path = out_template % p
+            if os.path.normcase(recorded.get(str(p)) or "") == os.path.normcase(os.path.basename(path)):
                 continue
+            if os.path.exists(path):
+                try:
+                    with open(path, "ab"):
+                        pass
+                except OSError:
+                    locked.append(os.path.basename(path))
+        if locked:
+            arcpy.AddError(
+                f"Existing outputs are locked by another process ({len(locked)}): {', '.join(locked)}. "
+                "Remove them from the map or close the app using them, then re-run."
+            )
+            raise arcpy.ExecuteError
+        handled = set()
 
-            # Reproject IN PLACE if/when needed (doesn't affect failure list)
-            try:
-                final_path = project_raster_in_place(output_path, target_sr)
-            except Exception as ex_post:
-                arcpy.AddWarning(f"[WARN] Post-process issue on page {page_1b}: {ex_post}")
-                final_path = output_path
-
-            # Add the one-and-only file to the map (same as base)
+        # Buffered [SKIP]/[WARN] lines must reach the GP pane even if the run dies or is cancelled
+        try:
+            # Rerun cache: pages of this exact PDF (same bytes, same target SR) that an earlier run
+            # already exported here are linked/copied into place instead of exported again
             try:
-                if map_obj:
-                    map_obj.addDataFromPath(final_path)
-            except Exception as ex_add:
-                arcpy.AddWarning(f"[WARN] Added TIFF but couldn't add to map (page {page_1b}): {ex_add}")
+                manifest = _load_manifest(output_folder, _pdf_fingerprint(input_pdf_path, target_wkt))
+            except OSError as ex_fp:
+                manifest = None
+                buf.warn(f"[WARN] Rerun cache disabled: {ex_fp}")
+            if manifest is not None:
+                for p in pages:
+                    cached_path = _reuse_cached_page(output_folder, manifest, p, out_template % p)
+                    if cached_path:
+                        finish_page(p, cached_path, [], reused=True)
+                        handled.add(p)
+
+            # Stale outputs are removed on a background thread, running ahead of the exports so
+            # each page's cleanup overlaps the previous page's PDFToTIFF. That thread only does
+            # plain file removes: arcpy env settings and GP tools aren't thread-safe, so every GP
+            # call (the locked-file Delete fallback, PDFToTIFF, ProjectRaster) stays on this thread.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as cleaner:
+                cleanups = {
+                    p: cleaner.submit(_remove_stale_files, out_template % p) for p in pages if p not in handled
+                }
+
+                def wait_cleanup(page_1b):
+                    if not cleanups[page_1b].result():
+                        _delete_stale(out_template % page_1b)  # locked leftover: GP Delete, here
+
+                if _POOL_WORKERS > 1 and len(pages) - len(handled) > 1:
+                    futures = {}
+                    cancelled = False
+                    try:
+                        pool = _get_pool()
+                        for p in pages:
+                            if p in handled:
+                                continue
+                            if arcpy.env.isCancelled:
+                                cancelled = True
+                                break
+                            wait_cleanup(p)
+                            fut = pool.submit(
+                                _export_one_page, input_pdf_path, out_template % p, p, target_wkt, target_key
+                            )
+                            futures[fut] = p
+                        # Wait in short slices so Cancel in Pro is noticed while workers are busy
+                        pending = set(futures)
+                        while pending and not cancelled:
+                            done, pending = concurrent.futures.wait(
+                                pending, timeout=0.5, return_when=concurrent.futures.FIRST_COMPLETED
+                            )
+                            for fut in done:
+                                page_1b = futures[fut]
+                                try:
+                                    final_path, warnings = fut.result()
+                                except (BrokenProcessPool, pickle.PicklingError):
+                                    raise
+                                except Exception as ex_export:
+                                    record_failure(page_1b, ex_export)
+                                else:
+                                    finish_page(page_1b, final_path, warnings)
+                                handled.add(page_1b)
+                            cancelled = arcpy.env.isCancelled
+                    except (BrokenProcessPool, pickle.PicklingError, OSError) as ex_pool:
+                        _discard_pool()
+                        buf.warn(f"[WARN] Worker pool unavailable, exporting remaining pages serially: {ex_pool}")
+                    finally:
+                        # The pool outlives this run: never leave its queue holding this run's pages
+                        for fut in futures:
+                            fut.cancel()
+                        if cancelled:
+                            _discard_pool()  # don't let pages already running keep the next run waiting
+                    if cancelled:
+                        buf.warn("[WARN] Cancelled — remaining pages were not exported")
+                        raise arcpy.ExecuteError
+
+                # Serial path — single-page runs, or whatever the pool didn't get to
+                for page_1b in pages:
+                    if page_1b in handled:
+                        continue
+                    if arcpy.env.isCancelled:
+                        buf.warn("[WARN] Cancelled — remaining pages were not exported")
+                        raise arcpy.ExecuteError
+                    wait_cleanup(page_1b)
+                    try:
+                        output_path, via_arcpy = _export_page(input_pdf_path, out_template % page_1b, page_1b)
+                    except Exception as ex_export:
+                        record_failure(page_1b, ex_export)
+                        continue
+                    warnings = []
+                    if via_arcpy:
+                        output_path = _finish_raster(output_path, target_wkt, target_key, warnings)
+                    finish_page(page_1b, output_path, warnings)
+
+            if manifest is not None:
+                _save_manifest(output_folder, manifest)
+        finally:
+            buf.flush()
 
         # ---------- Write failures (if any) into the Project's Default GDB and add table to map ----------
         if failures:
+            # Compact summary line for the GP Messages pane (built once, used on both paths below)
+            pages_str = ", ".join(map(str, (f.page for f in failures)))
             try:
-                gdb = aprx.defaultGeodatabase
-                if not gdb or not os.path.isdir(gdb):
-                    # Fallback to project home if default GDB missing (rare)
-                    gdb = aprx.homeFolder
+                gdb = default_gdb
 
                 # Table name includes Project ID; overwrite if already exists
                 safe_pid = self._sanitize_for_fs(project_id)
                 tbl_name = f"PDF2TIFF_Failures_{safe_pid}"
                 tbl_path = os.path.join(gdb, tbl_name)
+                if not gdb.lower().endswith(".gdb"):
+                    tbl_path += ".dbf"  # folder fallback: the dBASE table CreateTable used to make there
                 if arcpy.Exists(tbl_path):
                     arcpy.management.Delete(tbl_path)
 
-                # Create table & fields
-                arcpy.management.CreateTable(os.path.dirname(tbl_path), os.path.basename(tbl_path))
-                arcpy.management.AddField(tbl_path, "Page", "LONG")
-                arcpy.management.AddField(tbl_path, "PDF_Path", "TEXT", field_length=512)
-                arcpy.management.AddField(tbl_path, "Output_Path", "TEXT", field_length=512)
-                arcpy.management.AddField(tbl_path, "Error", "TEXT", field_length=1024)
-
-                # Insert rows
-                with arcpy.da.InsertCursor(tbl_path, ["Page", "PDF_Path", "Output_Path", "Error"]) as cur:
-                    for f in failures:
-                        cur.insertRow([f["page"], f["pdf_path"], f["output"], f["error"]])
+                # Create the table and write every row in one bulk call; the dtype is the schema
+                # (Page LONG, PDF_Path/Output_Path TEXT 512, Error TEXT 1024 — longer text is truncated)
+                arr = np.array(failures, dtype=_FAILURE_DTYPE)
+                arcpy.da.NumPyArrayToTable(arr, tbl_path)
 
                 # Add the table to the current map so it's visible in Contents
                 if map_obj:
@@ -352,17 +641,25 @@ class Tool:
                         pass
 
                 # Print a compact summary in the GP Messages pane
-                pages_str = ", ".join(str(f["page"]) for f in failures)
                 arcpy.AddWarning(f"[SUMMARY] Skipped pages ({len(failures)}): {pages_str}")
                 arcpy.AddMessage(f"[INFO] Failure details table added to project GDB: {tbl_name}")
 
             except Exception as ex_tbl:
                 arcpy.AddWarning(f"[WARN] Could not write failures table to project GDB: {ex_tbl}")
-                pages_str = ", ".join(str(f["page"]) for f in failures)
                 arcpy.AddWarning(f"[SUMMARY] Skipped pages ({len(failures)}): {pages_str}")
         else:
             arcpy.AddMessage("[SUMMARY] No pages were skipped.")
 
+        # Add the TIFFs to the map only now, on the main thread (still one addDataFromPath per
+        # TIFF — this just defers them past the export); pages finish out of order, so sort to
+        # keep Contents deterministic
+        if map_obj:
+            for page_1b, final_path in sorted(final_paths):
+                try:
+                    map_obj.addDataFromPath(final_path)
+                except Exception as ex_add:
+                    arcpy.AddWarning(f"[WARN] Added TIFF but couldn't add to map (page {page_1b}): {ex_add}")
+
         del aprx
         return
 
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+Per-page export and reprojection for the PDF2TIFF toolbox.
+
+Kept out of the toolbox file because ProcessPoolExecutor workers re-import whatever they
+run by module name, and Pro loads the toolbox itself as a .pyt that a spawned child can't
+import. PDF2TIFF puts this folder on sys.path before the pool starts.
+"""
+import os
+import uuid
+import arcpy
+
+try:
+    import fitz  # PyMuPDF — optional in-process rasterizer for plain (non-GeoPDF) pages
+except ImportError:
+    fitz = None
+
+# Same as PDFToTIFF's default resolution, so both export paths produce identical pixel sizes
+_RASTER_DPI = 250
+
+# (in_sr, out_sr) key pair -> resolved geographic transformation name
+_TRANSFORMS = {}
+
+
+def _remove_stale_files(output_path):
+    """
+    Plain-file removal of a previous export (TIFF + sidecars). Makes no GP calls, so it is
+    safe on a helper thread; returns False if something still holds a lock on the output.
+    """
+    root, _ = os.path.splitext(output_path)
+    for path in (output_path, output_path + ".aux.xml", output_path + ".ovr", output_path + ".xml", root + ".tfw"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            return False
+        except OSError:
+            pass
+    return True
+
+
+def _delete_stale(output_path):
+    # Clean any previous export (TIFF + sidecars) to avoid locks/warnings. Plain file removal
+    # skips the Delete GP tool, which is only needed when something still holds a lock.
+    if not _remove_stale_files(output_path):
+        try:
+            arcpy.management.Delete(output_path)
+        except Exception:
+            pass
+
+
+def _render_page_fitz(input_pdf_path, output_path, page_1b):
+    """Rasterize a page with PyMuPDF; returns False when it must go through PDFToTIFF instead."""
+    if fitz is None:
+        return False
+    try:
+        with fitz.open(input_pdf_path) as doc:
+            page = doc.load_page(page_1b - 1)
+            # GeoPDF georeferencing (/VP viewports, TerraGo /LGIDict) is only carried into
+            # GeoTIFF tags by arcpy — leave those pages to PDFToTIFF
+            for key in ("VP", "LGIDict"):
+                if doc.xref_get_key(page.xref, key)[0] != "null":
+                    return False
+            pix = page.get_pixmap(dpi=_RASTER_DPI)
+            # LZW like PDFToTIFF's default; Pillow would otherwise write the TIFF uncompressed
+            pix.pil_save(output_path, format="TIFF", dpi=(_RASTER_DPI, _RASTER_DPI), compression="tiff_lzw")
+        return True
+    except Exception:
+        # Missing Pillow, damaged page, ... — drop any partial file and let arcpy try
+        try:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+        except OSError:
+            pass
+        return False
+
+
+def _export_page(input_pdf_path, output_path, page_1b):
+    """
+    Export a single PDF page to TIFF (raises on failure). Returns (output_path, via_arcpy);
+    only PDFToTIFF output can carry a spatial reference worth checking afterwards.
+    """
+    # Plain pages skip the per-call geoprocessing overhead entirely
+    if _render_page_fitz(input_pdf_path, output_path, page_1b):
+        return output_path, False
+
+    # Base behavior that worked for you: (in_pdf, out_tif, pdf_password, pdf_page_number)
+    # (no outputCoordinateSystem override: PDFToTIFF would project without the datum
+    # transformation _pick_transform chooses, and ProjectRaster would then see a match)
+    arcpy.conversion.PDFToTIFF(
+        input_pdf_path,
+        output_path,
+        None,
+        page_1b
+    )
+    return output_path, True
+
+
+def _sr_from_wkt(wkt):
+    # SpatialReference objects don't cross process boundaries; their WKT string does
+    sr = arcpy.SpatialReference()
+    sr.loadFromString(wkt)
+    return sr
+
+
+# (page SR, target SR) -> (needs_reproj, gtrans), per process. Keyed by each page's own SR:
+# pages of one PDF can differ (a non-georeferenced cover sheet ahead of the map sheets)
+_REPROJ_PLANS = {}
+
+
+def _project_raster_in_place(in_path, out_sr, out_key, warnings):
+    """
+    Reproject 'in_path' to 'out_sr' IN PLACE (base behavior):
+    - If input has Unknown CRS -> no-op.
+    - If CRS matches out_sr -> no-op.
+    - Else move the original aside, ProjectRaster straight onto the final name, drop the original.
+    The match check and transformation pick are made once per distinct input SR.
+    Problems are appended to 'warnings' (workers can't reach the GP messages pane).
+    """
+    try:
+        # Raster opens the dataset directly; Describe would first probe what kind of data it is
+        in_sr = arcpy.Raster(in_path).spatialReference
+    except Exception as ex:
+        warnings.append(f"[WARN] Could not read spatial reference of {in_path}: {ex}")
+        return in_path
+
+    # Unknown CRS (export succeeded, just undefined — treat as success); decides nothing for other pages
+    if (in_sr is None) or (in_sr.name == "Unknown"):
+        return in_path
+
+    try:
+        plan_key = (in_sr.factoryCode or in_sr.exportToString(), out_key)
+    except Exception:
+        plan_key = None
+    plan = _REPROJ_PLANS.get(plan_key) if plan_key else None
+    if plan is None:
+        needs = not _sr_equal(in_sr, out_key)
+        plan = (needs, _pick_transform(in_sr, out_sr) if needs else "")
+        if plan_key:
+            _REPROJ_PLANS[plan_key] = plan
+    needs, gtrans = plan
+    if not needs:
+        return in_path
+
+    folder = os.path.dirname(in_path)
+    base, _ = os.path.splitext(os.path.basename(in_path))
+    orig_path = os.path.join(folder, f"{base}.__orig_{uuid.uuid4().hex}.tif")
+
+    # Rename is a metadata-only op; the .aux.xml sidecar travels with its raster
+    moves = [(in_path, orig_path)]
+    if os.path.exists(in_path + ".aux.xml"):
+        moves.append((in_path + ".aux.xml", orig_path + ".aux.xml"))
+    try:
+        for src, dst in moves:
+            os.replace(src, dst)
+    except Exception as ex_mv:
+        for src, dst in moves:
+            if os.path.exists(dst):
+                os.replace(dst, src)
+        warnings.append(f"[WARN] Reprojection skipped for {os.path.basename(in_path)}: {ex_mv}")
+        return in_path
+
+    try:
+        arcpy.management.ProjectRaster(
+            in_raster=orig_path,
+            out_raster=in_path,
+            out_coor_system=out_sr,
+            resampling_type="NEAREST",
+            cell_size=None,
+            geographic_transform=gtrans if gtrans else ""
+        )
+    except Exception as ex_proj:
+        # Reprojection failed — put the original back (don’t record as a page failure)
+        warnings.append(f"[WARN] Reprojection failed for {os.path.basename(in_path)}: {ex_proj}")
+        _delete_stale(in_path)  # any partial output
+        for src, dst in moves:
+            os.replace(dst, src)
+        return in_path
+
+    # Drop the moved-aside original and its sidecars with plain removes (no Delete GP call)
+    _delete_stale(orig_path)
+    return in_path
+
+
+def _finish_raster(output_path, out_sr_wkt, out_key, warnings):
+    # No target WKT means the map SR is Unknown: nothing to project onto, don't even open the raster
+    if not out_sr_wkt:
+        return output_path
+    try:
+        return _project_raster_in_place(output_path, _sr_from_wkt(out_sr_wkt), out_key, warnings)
+    except Exception as ex_post:
+        warnings.append(f"[WARN] Post-process issue on {os.path.basename(output_path)}: {ex_post}")
+        return output_path
+
+
+def _export_one_page(input_pdf_path, output_path, page_1b, out_sr_wkt=None, out_key=None):
+    """Export + reproject one page (runs in a worker). Returns (final_path, warnings); raises if the export fails."""
+    output_path, via_arcpy = _export_page(input_pdf_path, output_path, page_1b)
+    warnings = []
+    if not via_arcpy:
+        return output_path, warnings  # PyMuPDF output has no SR to reconcile
+    final_path = _finish_raster(output_path, out_sr_wkt, out_key, warnings)
+    return final_path, warnings
+
+
+def _sr_equal(a, b_key):
+    try:
+        a_code = a.factoryCode
+        if a_code and b_key[0]:
+            return a_code == b_key[0]  # EPSG code alone is authoritative
+        return a.name == b_key[1]
+    except Exception:
+        return False
+
+
+def _pick_transform(in_sr, out_sr):
+    # Every page of one PDF usually shares the same (in_sr, out_sr) pair; the memo is
+    # per process, so each warm worker hits ListTransformations once per pair
+    try:
+        pair = (in_sr.factoryCode or in_sr.exportToString(), out_sr.factoryCode or out_sr.exportToString())
+    except Exception:
+        return ""
+    if pair not in _TRANSFORMS:
+        _TRANSFORMS[pair] = _list_best_transform(in_sr, out_sr)
+    return _TRANSFORMS[pair]
+
+
+def _list_best_transform(in_sr, out_sr):
+    try:
+        cands = arcpy.ListTransformations(in_sr, out_sr)
+        if not cands:
+            return ""
+        for key in ("NAD_1983", "HARN", "NSRS2007", "2011", "ETRS", "NAVD"):
+            for c in cands:
+                if key in c:
+                    return c
+        return cands[0]
+    except Exception:
+        return ""
+
+
+def _warm_projection_db(target_sr=None):
+    # First SpatialReference / ListTransformations query opens and indexes the projection
+    # database; take that hit up front rather than on the first page. Purely a cache warm.
+    try:
+        wgs84 = arcpy.SpatialReference(4326)
+        wgs84.exportToString()
+        if target_sr is not None:
+            arcpy.ListTransformations(wgs84, target_sr)
+    except Exception:
+        pass
+
+
+def _init_worker():
+    # Unpickling this function already imported the module (and arcpy) in the worker
+    arcpy.env.overwriteOutput = True
+    _warm_projection_db()